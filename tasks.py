@@ -4,12 +4,10 @@ import logging
 from pathlib import Path
 from sys import exit
 
-from flask_frozen import Freezer
 from invoke import Task, task
 
-from website import create_app, db as _db
-from website.config import DevelopmentConfig
-from website.demo import setup_demo
+# Website's dependencies are imported inside tasks, and only when needed.
+# Otherwise, listing tasks or compiling CSS would import Flask and co. every time.
 
 here = Path(__file__).parent
 logger = logging.getLogger(__name__)
@@ -65,6 +63,9 @@ def run(ctx):
     # Cannot type commands in the interpreter.
     # env = {'FLASK_APP': FLASK_APP, 'FLASK_DEBUG': '1'}
     # ctx.run('flask run', env=env)
+    from website import create_app
+    from website.config import DevelopmentConfig
+
     app = create_app(DevelopmentConfig)
     app.run(debug=True)
 
@@ -75,6 +76,10 @@ def demo(ctx):
 
     The server can be accessed on http://localhost:5000/
     """
+    from website import create_app
+    from website.config import DevelopmentConfig
+    from website.demo import setup_demo
+
     app = create_app(DevelopmentConfig)
 
     if not app.config['DATABASE_PATH']:
@@ -87,8 +92,25 @@ def demo(ctx):
 # Utils
 
 @task
-def compile_css(ctx, css_file=CSS_FILE, style='compact'):
-    """Compile SASS files to a CSS stylesheet."""
+def compile_css(ctx, css_file=CSS_FILE, style='compact', force=False):
+    """Compile SASS files to a CSS stylesheet.
+
+    When using the default style, compilation is skipped if the stylesheet
+    is more recent than SASS files, unless forced.
+    """
+    css_file = Path(css_file)
+
+    # The style of an existing stylesheet is unknown:
+    # always compile when asking for another style than the default one.
+    if not force and style == 'compact' and css_file.exists():
+        # Partials are imported from all over SASS directory: check all of them.
+        sass_files = SASS_FILE.parent.rglob('*.scss')
+        last_change = max(f.stat().st_mtime for f in sass_files)
+
+        if css_file.stat().st_mtime >= last_change:
+            logger.info("Stylesheet already up to date")
+            return
+
     # TODO: Add current date as suffix (03/2019)
     # In order to not have missing styles when updating static files online.
     ctx.run(f'sassc -t {style} {SASS_FILE} {css_file}')
@@ -97,12 +119,17 @@ def compile_css(ctx, css_file=CSS_FILE, style='compact'):
 @task
 def create_db(ctx, path):
     """Create and initialize database."""
+    from website import create_app, db as _db
+    from website.config import DevelopmentConfig
+
     path = Path(path)
 
-    if path.exists():
+    try:
+        # Atomically fails if the file already exists (O_CREAT | O_EXCL).
+        path.touch(exist_ok=False)
+    except FileExistsError:
         exit("💥 Database already exists!")
 
-    path.touch()
     config = DevelopmentConfig(DATABASE_PATH=path)
     app = create_app(config)
 
@@ -114,8 +141,19 @@ def create_db(ctx, path):
 
 @task
 def freeze(ctx, dst=FROZEN_WEBSITE, preview=False):
-    config = DevelopmentConfig(FREEZER_DESTINATION=dst)
-    app = create_app(config)
+    from flask_frozen import Freezer
+
+    from website import create_app
+    from website.config import DevelopmentConfig
+
+    options = {'FREEZER_DESTINATION': dst, 'JINJA_BYTECODE_CACHE': True}
+
+    if not preview:
+        # Templates don't change while freezing: don't check them before each render.
+        # But keep reloading them during preview, to see changes straight away.
+        options['TEMPLATES_AUTO_RELOAD'] = False
+
+    app = create_app(DevelopmentConfig(**options))
     freezer = Freezer(app)
 
     if preview:
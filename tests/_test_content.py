@@ -88,11 +88,8 @@ class BaseDocumentHandlerTest(ABC):
 
     # Get source.
 
-    async def test_document_source_is_automatically_loaded(self, tmp_path):
-        source_file = tmp_path / 'document.html'
-        source_file.write_text("Hello, World!")
-
-        parser = await self.handler(source_file).source
+    async def test_document_source_is_automatically_loaded(self, hello_world):
+        parser = await self.handler(hello_world).source
         assert parser.source.text_content() == "Hello, World!"
 
     async def test_load_not_existing_document_source(self, tmp_path):
@@ -103,11 +100,8 @@ class BaseDocumentHandlerTest(ABC):
 
     # Load document.
 
-    async def test_load_document(self, tmp_path):
-        source_file = tmp_path / 'document.html'
-        source_file.write_text("Hello, World!")
-
-        parser = await self.handler(source_file).load()
+    async def test_load_document(self, hello_world):
+        parser = await self.handler(hello_world).load()
         assert parser.source.text_content() == "Hello, World!"
 
     async def test_load_not_existing_document(self, tmp_path):
@@ -184,9 +178,19 @@ class BaseDocumentSourceParserTest:
 
     # Initialize parser.
 
-    def test_source_must_be_valid_html(self):
+    @pytest.mark.parametrize('source', ['', b'', ' \n'])
+    def test_source_must_be_valid_html(self, source):
         with pytest.raises(exceptions.DocumentMalformatted):
-            self.parser('')
+            self.parser(source)
+
+    @pytest.mark.parametrize('head', [
+        '<meta charset="utf-8"><title>Café</title>',
+        '<title>Café</title>',  # Without charset declaration
+    ])
+    def test_source_can_be_given_as_bytes(self, head):
+        html = f'<html><head>{head}</head></html>'
+        title = self.parser(html.encode('utf-8')).parse_title()
+        assert title == 'Café'
 
     # Parse title.
 
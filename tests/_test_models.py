@@ -4,6 +4,7 @@ from datetime import date
 from typing import ClassVar
 
 import pytest
+from sqlalchemy import Column
 
 from website import exceptions
 from website.factories import BaseDatabaseFactory
@@ -23,22 +24,56 @@ class BaseTestModel:
     #: Model's name in database (i.e., table's name).
     table: ClassVar[str] = None
 
-    @pytest.fixture(scope='class')
-    def filterable_column(self):
-        filterable = filter(
-            lambda c: (c.type.python_type is str) and not c.unique,
-            self.model.__table__.columns.values(),
+    #: Names of the model's columns which must be defined.
+    mandatory_fields: ClassVar[tuple] = ()
+    #: Names of the model's columns which can be left empty.
+    optional_fields: ClassVar[tuple] = ()
+    #: String column, used to test filtering.
+    _filterable_column: ClassVar[Column] = None
+
+    def __init_subclass__(cls, **kwargs):
+        """Introspect model's columns once, when defining test classes."""
+        super().__init_subclass__(**kwargs)
+
+        if cls.model is None:
+            return
+
+        def is_mandatory(field):
+            if field.nullable:
+                return False
+
+            if field.primary_key and field.type.python_type is int:
+                if field.autoincrement == 'auto':
+                    return False
+
+            return True
+
+        columns = cls.model.__table__.columns.values()
+        cls.mandatory_fields = tuple(c.name for c in columns if is_mandatory(c))
+        cls.optional_fields = tuple(c.name for c in columns if c.nullable)
+
+        cls._filterable_column = next(
+            (c for c in columns if c.type.python_type is str and not c.unique),
+            None,
         )
 
-        try:
-            return next(filterable)
-        except StopIteration:
+        if cls._filterable_column is None:
             error = (
                 f"Cannot use {BaseTestModel.__name__} "
-                f"for testing {self.model.__name__}"
+                f"for testing {cls.model.__name__}"
             )
             raise RuntimeError(error)
 
+    def pytest_generate_tests(self, metafunc):
+        """Test every mandatory field separately."""
+        if 'mandatory_field' in metafunc.fixturenames:
+            # Test is automatically skipped when there is no mandatory field.
+            metafunc.parametrize('mandatory_field', self.mandatory_fields)
+
+    @pytest.fixture(scope='class')
+    def filterable_column(self):
+        return self._filterable_column
+
     @pytest.fixture(scope='class')
     def feed(self, filterable_column):
         return {filterable_column.name: 'to_keep'}
@@ -60,60 +95,30 @@ class BaseTestModel:
         item = self.factory.build()
         assert item.doc_type == self.doc_type
 
-    def test_mandatory_fields_must_be_defined(self, db):
-        def is_mandatory(field):
-            if field.nullable:
-                return False
+    def test_mandatory_fields_must_be_defined(self, mandatory_field):
+        item = self.factory.build(**{mandatory_field: None})
 
-            if field.primary_key and field.type.python_type is int:
-                if field.autoincrement == 'auto':
-                    return False
-
-            return True
-
-        mandatory_fields = [
-            c.name for c in self.model.__table__.columns.values() if is_mandatory(c)
-        ]
-
-        if not mandatory_fields:
-            pytest.skip("This model doesn't have optional fields")
-
-        for field in mandatory_fields:
-            item = self.factory.build(**{field: None})
-
-            with pytest.raises(exceptions.InvalidItem):
-                item.save()
-
-            # XXX: Could maybe use pytest.mark.parametrize instead (03/2019)
-            # If the following proposal gets implemented:
-            # https://github.com/pytest-dev/pytest/issues/349
-            # In which case, mandatory and optional fields could be defined
-            # inside fixtures. So we don't have to rollback manually the db
-            # (already done during teardown in the db fixture after each test).
-            db.session.rollback()
+        with pytest.raises(exceptions.InvalidItem):
+            item.save()
 
     def test_optional_fields_do_not_have_to_bet_defined(self):
-        optional_fields = [
-            c.name for c in self.model.__table__.columns.values() if c.nullable
-        ]
-
-        if not optional_fields:
+        if not self.optional_fields:
             pytest.skip("This model doesn't have optional fields")
 
-        optional = {f: None for f in optional_fields}
+        optional = {f: None for f in self.optional_fields}
         self.factory(**optional)  # Should not raise
 
     # Retrieve all items.
 
     def test_retrieve_all_items(self):
-        items = self.factory.create_batch(2)
+        items = self.factory.create_batch_by_uri(['item_1', 'item_2'])
         assert self.model.all() == items
 
     # Filter items.
 
     def test_filter_items(self, feed, filtrate, residue):
         self.factory(**filtrate)
-        expected = self.factory.create_batch(2, **residue)
+        expected = self.factory.create_batch_by_uri(['item_1', 'item_2'], **residue)
         actual = self.model.filter(**feed)
         assert actual == expected
 
@@ -130,7 +135,7 @@ class BaseTestModel:
             self.model.find(**residue)
 
     def test_finding_similar_items_raises_an_exception(self, residue):
-        self.factory.create_batch(2, **residue)
+        self.factory.create_batch_by_uri(['item_1', 'item_2'], **residue)
 
         with pytest.raises(exceptions.MultipleItemsFound):
             self.model.find(**residue)
@@ -19,6 +19,12 @@ def splinter_driver_kwargs():
     return {'headless': True}
 
 
+@pytest.fixture(scope='session')
+def splinter_firefox_profile_preferences(splinter_firefox_profile_preferences):
+    """Don't load images, as they are never checked during tests."""
+    return {**splinter_firefox_profile_preferences, 'permissions.default.image': 2}
+
+
 @pytest.fixture(scope='session')
 def splinter_screenshot_dir():
     """Don't store the screenshots in the current working directory."""
@@ -38,21 +38,27 @@ def article_is_displayed(browser, articles):
     # We are reading the most recent article, which is also the last one created.
     article = articles[-1]
 
-    assert browser.is_text_present(article.title)
-
+    # Fetch the article only once, and look for its title and content in Python.
     # Cannot use .is_text_present() to check if the article's content is present,
     # as this method strips all HTML tags before performing the verification.
-    assert article.body in browser.find_by_css('.article')[0].html
+    html = browser.evaluate_script("document.querySelector('.article').innerHTML")
+
+    assert article.title in html
+    assert article.body in html
 
 
 @then("I should see all articles")
 def articles_are_displayed(browser, articles):
-    displayed_articles = browser.find_by_css('.article-list__title')
-    assert len(displayed_articles) == len(articles)
+    count = browser.evaluate_script(
+        "document.querySelectorAll('.article-list__title').length")
+    assert count == len(articles)
 
 
 @then("they should be sorted chronologically in descending order")
 def articles_are_sorted_in_descending_order(browser, articles):
-    actual = [article.text for article in browser.find_by_css('.article-list__title')]
+    # Retrieve all titles at once, instead of querying the browser for each of them.
+    actual = browser.evaluate_script(
+        "Array.from(document.querySelectorAll('.article-list__title'))"
+        ".map(title => title.textContent.trim())")
     expected = [article.title for article in articles[::-1]]
     assert actual == expected
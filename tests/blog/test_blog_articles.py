@@ -1,3 +1,4 @@
+import asyncio
 from datetime import date
 from pathlib import PurePath
 
@@ -81,12 +82,11 @@ class TestArticleHandler(BaseDocumentHandlerTest):
     async def test_insert_documents_in_batch(self, answers, db, prompt, source_file):
         # Test
         source_file_1 = source_file.symlink('blog/2019/03-08.batch_1.html')
-        handler_1 = self.handler(source_file_1, prompt=prompt)
-        article_1 = await handler_1.insert(batch=True)
-
         source_file_2 = source_file.symlink('blog/2019/03-08.batch_2.html')
-        handler_2 = self.handler(source_file_2, prompt=prompt)
-        article_2 = await handler_2.insert(batch=True)
+        article_1, article_2 = await asyncio.gather(
+            self.handler(source_file_1, prompt=prompt).insert(batch=True),
+            self.handler(source_file_2, prompt=prompt).insert(batch=True),
+        )
 
         assert not article_1.exists()
         assert not article_2.exists()
@@ -383,7 +383,7 @@ class TestArticleHandler(BaseDocumentHandlerTest):
 
     def test_articles_must_be_organized_by_year(self):
         path = PurePath('blog/04-08.article.txt')
-        with pytest.raises(ValueError):
+        with pytest.raises(exceptions.ArticleDateMalformatted):
             self.handler(path).scan_date()
 
     @pytest.mark.parametrize('path', [
@@ -391,10 +391,11 @@ class TestArticleHandler(BaseDocumentHandlerTest):
         'blog/2019/04.article.txt',
         'blog/2019/04-.article.txt',
         'blog/2019/john-doe.article.txt',
+        'blog/2019/13-01.article.txt',
     ])
     def test_articles_must_be_classified_by_month_and_day(self, path):
         path = PurePath(path)
-        with pytest.raises(ValueError):
+        with pytest.raises(exceptions.ArticleDateMalformatted):
             self.handler(path).scan_date()
 
 
@@ -12,9 +12,8 @@ class TestArticleModel(BaseTestDocumentModel):
     table = 'articles'
 
     def test_tag_list_is_always_sorted(self):
-        tag_1 = factories.TagFactory(uri='tag_1')
-        tag_2 = factories.TagFactory(uri='tag_2')
-        tag_3 = factories.TagFactory(uri='tag_3')
+        tag_1, tag_2, tag_3 = factories.TagFactory.create_batch_by_uri(
+            ['tag_1', 'tag_2', 'tag_3'])
 
         # When creating a new article.
         article = factories.ArticleFactory(tags=[tag_2, tag_1, tag_3])
@@ -25,8 +24,7 @@ class TestArticleModel(BaseTestDocumentModel):
         assert article.tags == [tag_1, tag_2, tag_3]
 
         # When adding new tags.
-        tag_0 = factories.TagFactory(uri='tag_0')
-        tag_4 = factories.TagFactory(uri='tag_4')
+        tag_0, tag_4 = factories.TagFactory.create_batch_by_uri(['tag_0', 'tag_4'])
 
         article.tags.add(tag_0)
         article.tags.add(tag_4)
@@ -79,6 +79,14 @@ def fixtures(tmp_path_factory):
     return FileFixtureCollection(directory, symlinks)
 
 
+@pytest.fixture(scope='session')
+def hello_world(tmp_path_factory):
+    """Document's source file, written once and shared between tests."""
+    source_file = tmp_path_factory.mktemp('documents') / 'document.html'
+    source_file.write_text("Hello, World!")
+    return source_file
+
+
 # Web Tests
 
 @pytest.fixture(scope='session')
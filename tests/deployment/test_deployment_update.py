@@ -1,3 +1,4 @@
+import asyncio
 from datetime import datetime
 
 import pytest
@@ -19,6 +20,13 @@ class TestCloudFilesManager:
 
         return [file_1, file_2, file_3]
 
+    # Initialize manager.
+
+    def test_keep_one_connection_alive_per_transfer(self, cloud, object_store):
+        adapter = cloud.session.adapters['https://']
+        pool_settings = adapter.poolmanager.connection_pool_kw
+        assert pool_settings['maxsize'] == object_store.concurrency
+
     # Upload file.
 
     async def test_upload_file(self, object_store, static_files):
@@ -29,6 +37,26 @@ class TestCloudFilesManager:
         upload = await object_store.upload(static_files[0], 'static/new_name.txt')  # noqa: E501
         assert upload.name == 'static/new_name.txt'
 
+    async def test_stream_big_file(self, monkeypatch, object_store, static_files):
+        upload_object = object_store.object_store.upload_object
+        uploads = []
+
+        def spy(*args, **kwargs):
+            uploads.append(kwargs)
+            return upload_object(*args, **kwargs)
+
+        monkeypatch.setattr(object_store.object_store, 'upload_object', spy)
+        object_store.streaming_threshold = 0
+        upload = await object_store.upload(static_files[0])
+
+        # File is given as an open file, not by name, to avoid extra requests.
+        assert 'filename' not in uploads[0]
+        assert hasattr(uploads[0]['data'], 'read')
+        assert upload.data is None  # File is closed after upload
+
+        data = await object_store.download(upload.name)
+        assert data == b"Hello, World!"
+
     async def test_upload_not_existing_file(self, object_store, tmp_path):
         static_file = tmp_path / 'missing.txt'
 
@@ -61,6 +89,13 @@ class TestCloudFilesManager:
         md5_hash = await object_store.md5sum(static_files[0])
         assert md5_hash == '65a8e27d8879283831b664bd8b7f0ad4'
 
+    async def test_compute_md5_hash_of_empty_file(self, object_store, tmp_path):
+        static_file = tmp_path / 'empty.txt'
+        static_file.touch()
+
+        md5_hash = await object_store.md5sum(static_file)
+        assert md5_hash == 'd41d8cd98f00b204e9800998ecf8427e'
+
     async def test_compute_md5_hash_of_not_existing_file(
             self, object_store, tmp_path):
         static_file = tmp_path / 'missing.txt'
@@ -68,6 +103,18 @@ class TestCloudFilesManager:
         with pytest.raises(OSError):
             await object_store.md5sum(static_file)
 
+    # Retrieve remote MD5 hashes.
+
+    async def test_retrieve_checksums(self, object_store, static_files):
+        await object_store.add(static_files[:1])
+        checksums = await object_store.checksums()
+        assert checksums == {str(static_files[0]): '65a8e27d8879283831b664bd8b7f0ad4'}
+
+    async def test_error_happening_while_retrieving_checksums(
+            self, network, object_store):
+        with network.unplug(), pytest.raises(exceptions.CloudError):
+            await object_store.checksums()
+
     # Add files.
 
     async def test_add_files(self, object_store, static_files):
@@ -100,6 +147,25 @@ class TestCloudFilesManager:
         assert objs[1].name == 'static/john_doe.txt'
         assert objs[1].data == b"I'm John Doe."
 
+    async def test_add_files_with_bounded_concurrency(
+            self, monkeypatch, object_store, static_files):
+        transfers = []
+        upload = object_store.upload
+
+        async def count_transfers(src, dst=None):
+            transfers.append(src)
+            assert len(transfers) <= object_store.concurrency
+            await asyncio.sleep(0)  # Let other uploads start
+            obj = await upload(src, dst)
+            transfers.remove(src)
+            return obj
+
+        monkeypatch.setattr(object_store, 'upload', count_transfers)
+        object_store.concurrency = 2
+
+        objs = await object_store.add(static_files)
+        assert len(objs) == 3
+
     async def test_add_file_with_missing_source(self, object_store, tmp_path):
         static_file = tmp_path / 'missing.txt'
 
@@ -0,0 +1,7 @@
+from website.content import BaseDocumentSourceParser
+
+from tests._test_content import BaseDocumentSourceParserTest  # noqa: I100
+
+
+class TestBaseDocumentSourceParser(BaseDocumentSourceParserTest):
+    parser = BaseDocumentSourceParser
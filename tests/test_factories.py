@@ -0,0 +1,22 @@
+from website.blog import factories, models
+
+
+class TestBaseDatabaseFactory:
+    def test_create_batch_by_uri(self, db, monkeypatch):
+        commits = []
+        commit = db.session.commit
+
+        def count_commits():
+            commits.append(None)
+            commit()
+
+        monkeypatch.setattr(db.session, 'commit', count_commits)
+
+        tags = factories.TagFactory.create_batch_by_uri(
+            ['tag_1', 'tag_2'], name="Same Name")
+
+        assert len(commits) == 1
+        assert models.Tag.all() == tags
+
+        assert [tag.uri for tag in tags] == ['tag_1', 'tag_2']
+        assert all(tag.name == "Same Name" for tag in tags)
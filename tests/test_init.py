@@ -23,6 +23,34 @@ class TestApplicationFactory:
             with app.test_request_context():
                 flask.render_template_string('{{ undefined_variable }}')
 
+    def test_jinja2_bytecode_cache_can_be_enabled(self):
+        app = website.create_app(_TestingConfig)
+        assert app.jinja_env.bytecode_cache is None
+
+        app = website.create_app(_TestingConfig(JINJA_BYTECODE_CACHE=True))
+        assert isinstance(
+            app.jinja_env.bytecode_cache, jinja2.FileSystemBytecodeCache)
+
+    def test_blog_templates_are_compiled_at_startup(self):
+        app = website.create_app(_TestingConfig)
+        compiled = {name for _, name in app.jinja_env.cache.keys()}
+        assert {'blog.html', 'article.html'} <= compiled
+
+    def test_sqlite_pragmas_are_set_on_connection(self, tmp_path):
+        database = tmp_path / 'test.db'
+        config = _TestingConfig(
+            SQLALCHEMY_DATABASE_URI=f'sqlite:///{database}',
+            SQLITE_PRAGMAS={'cache_size': -1234})
+        app = website.create_app(config)
+
+        # Database's engine shouldn't be created with the application.
+        assert not app.extensions['sqlalchemy'].connectors
+
+        with app.app_context():
+            cache_size = website.db.session.execute('PRAGMA cache_size').scalar()
+
+        assert cache_size == -1234
+
     def test_set_config(self):
         class TestConfig(_TestingConfig):
             CLASS_CONFIG_KEY = 'class'
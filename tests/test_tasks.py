@@ -22,6 +22,23 @@ def test_compile_css(invoke, sass, tmpdir):
     assert css.size() > 0
 
 
+def test_compile_css_when_stylesheet_is_up_to_date(invoke, tmpdir):
+    css = tmpdir.join('stylesheet.css')
+    css.write('body {}')
+
+    invoke.run(f'compile-css --css-file {css}', check=True)
+    assert css.read() == 'body {}'
+
+
+def test_compile_css_with_another_style_when_stylesheet_is_up_to_date(
+        invoke, sass, tmpdir):
+    css = tmpdir.join('stylesheet.css')
+    css.write('body {}')
+
+    invoke.run(f'compile-css --css-file {css} --style compressed', check=True)
+    assert css.read() != 'body {}'
+
+
 class TestCreateDB:
     def test_create_new_db(self, invoke, tmpdir):
         db = tmpdir.join('test.db')
@@ -114,3 +114,32 @@ class TestRepository:
             'deleted': [],
         }
         assert actual == expected
+
+    def test_diff_with_file_renamed_and_modified_at_once(self, git, tmp_path):
+        repo = git.init(tmp_path)
+
+        # Keep content similar enough, for Git to detect the renaming.
+        content = "to rename and modify\n" * 10
+
+        to_rename = tmp_path / 'to_rename.txt'
+        to_rename.write_text(content)
+
+        repo.add(to_rename)
+        repo.commit("HEAD~1")
+
+        renamed = tmp_path / 'renamed.txt'
+        to_rename.rename(renamed)
+        renamed.write_text(content + "modified\n")
+
+        repo.add()
+        repo.commit("HEAD")
+
+        actual = repo.diff('HEAD~1')
+
+        expected = {
+            'added': [],
+            'modified': [Path('renamed.txt')],
+            'renamed': [(Path('to_rename.txt'), Path('renamed.txt'))],
+            'deleted': [],
+        }
+        assert actual == expected
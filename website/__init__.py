@@ -1,8 +1,12 @@
 import inspect
+import sqlite3
+from typing import Any
 
 import jinja2
-from flask import Blueprint, Flask
+from flask import Blueprint, current_app, Flask, has_app_context
 from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
 from werkzeug.datastructures import ImmutableDict
 
 from website.config import DevelopmentConfig, IN_MEMORY_DATABASE
@@ -27,6 +31,10 @@ def create_app(config=DevelopmentConfig):
     app.jinja_options = ImmutableDict(
         undefined=jinja2.StrictUndefined, **app.jinja_options)
 
+    if app.config['JINJA_BYTECODE_CACHE']:
+        app.jinja_options = ImmutableDict(
+            bytecode_cache=jinja2.FileSystemBytecodeCache(), **app.jinja_options)
+
     # Initialize application.
     db.init_app(app)
 
@@ -46,4 +54,22 @@ def create_app(config=DevelopmentConfig):
     return app
 
 
+@event.listens_for(Engine, 'connect')
+def set_sqlite_pragmas(connection: Any, _record: Any) -> None:
+    """Set SQLite pragmas of the current application on every new connection.
+
+    Listening to all engines, so database's engine doesn't have to be created
+    when creating the application.
+    """
+    if not (has_app_context() and isinstance(connection, sqlite3.Connection)):
+        return
+
+    cursor = connection.cursor()
+
+    for name, value in current_app.config['SQLITE_PRAGMAS'].items():
+        cursor.execute(f'PRAGMA {name} = {value}')
+
+    cursor.close()
+
+
 from . import views  # noqa: E402, F401
@@ -4,4 +4,15 @@ from flask import Blueprint
 
 blog = Blueprint('blog', __name__, template_folder='templates')
 
+
+@blog.record_once
+def preload_templates(state):
+    """Compile blog's templates when starting the application.
+
+    Otherwise, they are compiled when rendering the first web pages.
+    """
+    for template in ('blog.html', 'article.html'):
+        state.app.jinja_env.get_template(template)
+
+
 from website.blog import views  # noqa: E402, F401
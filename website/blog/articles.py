@@ -19,17 +19,19 @@ logger = logging.getLogger(__name__)
 class ArticleSourceParser(BaseDocumentSourceParser):
     """Parse source file of a blog article."""
 
+    _lead_selector = CSSSelector(
+        'html body div#content div#preamble p', translator='html')
+    _body_selector = CSSSelector(
+        'html body div#content div.sect1', translator='html')
+
     def parse_category(self) -> str:
         """Look for article's category.
 
         :raise ~.ArticleCategoryMissing: when no category is found.
         """
-        parser = CSSSelector('html head meta[name=description]')
+        category = self.parse_metadata().get('description')
 
-        try:
-            category = parser(self.source)[0].get('content')
-            assert category is not None
-        except (AssertionError, IndexError):
+        if category is None:
             raise exceptions.ArticleCategoryMissing(self)
 
         return category
@@ -40,19 +42,16 @@ class ArticleSourceParser(BaseDocumentSourceParser):
         :raise ~.ArticleLeadMissing: when no lead paragraph is found.
         :raise ~.ArticleLeadMalformatted: when multiple lead paragraphs are found.
         """
-        parser = CSSSelector('html body div#content div#preamble p')
-        lead = parser(self.source)
+        lead = self._lead_selector(self.source)
 
-        try:
-            assert len(lead) < 2
-        except AssertionError:
+        if len(lead) > 1:
             raise exceptions.ArticleLeadMalformatted(self)
 
-        try:
+        if lead:
             lead = lead[0].text_content().strip()
             lead = re.sub(r'\s+', r' ', lead)
-            assert lead
-        except (AssertionError, IndexError):
+
+        if not lead:
             raise exceptions.ArticleLeadMissing(self)
 
         return lead
@@ -62,12 +61,9 @@ class ArticleSourceParser(BaseDocumentSourceParser):
 
         :raise ~.ArticleBodyMissing: when no body is found.
         """
-        parser = CSSSelector('html body div#content div.sect1')
-        body = parser(self.source)
+        body = self._body_selector(self.source)
 
-        try:
-            assert body
-        except AssertionError:
+        if not body:
             raise exceptions.ArticleBodyMissing(self)
 
         body = ''.join(lxml.etree.tounicode(section) for section in body)
@@ -86,6 +82,10 @@ class ArticleHandler(BaseDocumentHandler):
     model = Article
     parser = ArticleSourceParser
 
+    # Patterns are compiled once, instead of every time a path is scanned.
+    _year_pattern = re.compile(r'\d{4}')
+    _month_day_pattern = re.compile(r'(\d{1,2})-(\d{1,2})\.')
+
     # Main API
 
     async def process(self, *, batch: bool = False) -> None:
@@ -173,12 +173,16 @@ class ArticleHandler(BaseDocumentHandler):
     def scan_date(self) -> date:
         """Return article's creation date, based on its :attr:`path`.
 
-        :raise ~.ArticleDateMalformatted: when the article is not
+        :raise ~.ArticleDateMalformatted:
+            when the article is not organized by year, month and day.
         """
-        try:
-            year = int(self.path.parent.name)
-            month, day = map(int, self.path.name.split('.')[0].split('-'))
-        except (IndexError, TypeError):
+        year = self._year_pattern.fullmatch(self.path.parent.name)
+        month_day = self._month_day_pattern.match(self.path.name)
+
+        if not (year and month_day):
             raise exceptions.ArticleDateMalformatted(self)
 
-        return date(year, month, day)
+        try:
+            return date(int(year[0]), int(month_day[1]), int(month_day[2]))
+        except ValueError:  # E.g., 13th month of the year
+            raise exceptions.ArticleDateMalformatted(self)
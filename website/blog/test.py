@@ -3,6 +3,7 @@
 from datetime import date, timedelta
 from typing import List
 
+from website import db
 from website.blog.factories import ArticleFactory
 from website.blog.models import Article
 
@@ -15,7 +16,13 @@ def create_articles(count: int) -> List[Article]:
     :param count: number of articles to create.
     """
     today = date.today()
-    return [
-        ArticleFactory(publication_date=today - timedelta(days=days))
+    articles = [
+        ArticleFactory.build(publication_date=today - timedelta(days=days))
         for days in range(count, 0, -1)
     ]
+
+    # Commit only once, instead of after each article (and its category and tags).
+    db.session.add_all(articles)
+    db.session.commit()
+
+    return articles
@@ -18,6 +18,13 @@ class DefaultConfig:
     # However, a default value should be set to False in a near future.
     SQLALCHEMY_TRACK_MODIFICATIONS = False
 
+    #: SQLite pragmas to set on every new database connection.
+    SQLITE_PRAGMAS = {}
+
+    #: Persist compiled templates on disk, in a temporary directory,
+    #: to not compile them again every time the application starts.
+    JINJA_BYTECODE_CACHE = False
+
     def __init__(self, **kwargs):
         self.__dict__.update(**kwargs)
 
@@ -4,16 +4,16 @@ Mainly base classes to be inherited by website's components.
 """
 
 import logging
+import re
 from abc import ABC, abstractmethod
 from contextlib import AbstractAsyncContextManager
 from dataclasses import dataclass
 from pathlib import Path, PurePath
-from typing import Callable, ClassVar, List, Union
+from typing import Callable, ClassVar, Dict, List, Union
 
 import aiofiles
 import lxml.etree
 import lxml.html
-from lxml.cssselect import CSSSelector
 
 from website import exceptions
 from website.blog.models import Category, Tag
@@ -25,6 +25,12 @@ DocumentPath = Union[Path, PurePath]  # For prod and tests
 
 logger = logging.getLogger(__name__)
 
+#: Shared by all parsers, to not instantiate a new one for every document.
+#: IDs are not looked up, so there is no need to index them.
+#: Undecoded sources are always read as UTF-8: lxml would fall back to Latin-1
+#: otherwise, when no ``<meta charset>`` is given.
+HTML_PARSER = lxml.html.HTMLParser(collect_ids=False, encoding='utf-8')
+
 
 class DocumentPrompt(AsyncPrompt):
     """User prompt used during documents update in database."""
@@ -233,36 +239,71 @@ class BaseDocumentSourceParser:
     :raise ~.DocumentMalformatted: when the given source is not valid HTML.
     """
 
-    def __init__(self, source: str):
+    # Selectors are compiled once, when the class is defined,
+    # instead of every time a document is parsed.
+    # All metadata are fetched at once, to walk through document's head only once.
+    _metadata_selector = lxml.etree.XPath(
+        '/html/head/title | /html/head/meta[@name="keywords" or @name="description"]')
+    # Separator swallows surrounding spaces, to avoid stripping each tag afterwards.
+    _tags_separator = re.compile(r'\s*,\s*')
+
+    def __init__(self, source: Union[bytes, str]):
+        # Source can be given undecoded, but must then be encoded in UTF-8.
+
+        # Don't even bother to instantiate a parser.
+        if not source.strip():
+            raise exceptions.DocumentMalformatted(source)
+
         try:
-            self.source = lxml.html.document_fromstring(source)
+            self.source = lxml.html.document_fromstring(source, parser=HTML_PARSER)
         except lxml.etree.ParserError:
             raise exceptions.DocumentMalformatted(source)
 
+        self._metadata = None
+
+    def parse_metadata(self) -> Dict[str, str]:
+        """Look for document's title and meta tags.
+
+        Metadata are only looked for once, and then cached.
+
+        :return: metadata, with ``title``, ``keywords`` and ``description`` keys
+            if found in the document.
+        """
+        if self._metadata is None:
+            metadata = {}
+
+            for element in self._metadata_selector(self.source):
+                if element.tag == 'title':
+                    metadata.setdefault('title', element.text_content())
+                elif element.get('content') is not None:
+                    metadata.setdefault(element.get('name'), element.get('content'))
+
+            self._metadata = metadata
+
+        return self._metadata
+
     def parse_title(self) -> str:
         """Look for document's title.
 
         :raise ~.DocumentTitleMissing: when no title is found.
         """
-        parser = CSSSelector('html head title')
+        title = self.parse_metadata().get('title')
 
-        try:
-            title = parser(self.source)[0].text_content()
-            assert title
-        except (AssertionError, IndexError):
+        if not title:
             raise exceptions.DocumentTitleMissing(self)
 
         return title
 
     def parse_tags(self) -> List[str]:
         """Look for document's tags."""
-        parser = CSSSelector('html head meta[name=keywords]')
+        tags = self.parse_metadata().get('keywords')
 
-        try:
-            tags = parser(self.source)[0].get('content', '')
-            tags = [tag.strip() for tag in tags.split(',')]
-            assert all(tags)
-        except (AssertionError, IndexError):
+        if tags is None:
+            return []
+
+        tags = self._tags_separator.split(tags.strip())
+
+        if not all(tags):
             return []
 
         return tags
@@ -8,6 +8,7 @@ from copy import copy
 from datetime import datetime
 from hashlib import md5
 
+from keystoneauth1.session import Session
 from openstack.connection import Connection
 from openstack.exceptions import (
     InvalidRequest, NotFoundException, ResourceNotFound, SDKException)
@@ -38,6 +39,7 @@ class CloudStubConnection:
             strict_proxies=False, **kwargs):
 
         self.object_store = CloudStubObjectStore(_connection=self)
+        self.session = session or Session()  # Never used to send requests
 
         # To simulate network perturbations, when manipulating containers or objects.
         # Must be manually assigned after instantiation.
@@ -121,6 +123,9 @@ class CloudStubObjectStore(CloudStubResource):
         if name is None:
             raise InvalidRequest("Request requires an ID but none was found")
 
+        if hasattr(data, 'read'):  # Streamed file
+            data = data.read()
+
         obj = CloudStubObject(container=container_name, name=name, data=data)
         self._containers[container_name]._objects[name] = obj
 
@@ -1,11 +1,15 @@
 import asyncio
 import logging
+import mmap
+import os
 import sys
+from functools import partial
 from hashlib import md5
 from pathlib import Path
-from typing import BinaryIO, Iterable, List, TextIO, Union
+from typing import Any, BinaryIO, Callable, Dict, Iterable, List, TextIO, Union
 
 import aiofiles
+from keystoneauth1.session import TCPKeepAliveAdapter
 from openstack.exceptions import ResourceNotFound, SDKException
 
 from website.deployment import exceptions
@@ -20,12 +24,28 @@ class CloudFilesManager:
 
     https://docs.openstack.org/openstacksdk/latest/user/proxies/object_store.html
     """  # noqa: E501
+
+    #: Files bigger than that (in bytes) are streamed during upload.
+    #: Smaller files are faster to read at once.
+    streaming_threshold: int = 64 * 1024
+
     def __init__(
             self, connection: CloudConnection, container: str,
-            quiet: bool = False, output: TextIO = sys.stdout):
+            quiet: bool = False, output: TextIO = sys.stdout,
+            concurrency: int = 16):
         self.quiet = quiet
         self.output = output
 
+        #: Maximum number of files transferred at the same time.
+        #: Prevent running out of file descriptors with large websites.
+        self.concurrency = concurrency
+
+        # Keep one HTTP connection alive per concurrent transfer.
+        # Requests only pools 10 connections per host by default:
+        # connections beyond would be closed and established again (with TLS).
+        adapter = TCPKeepAliveAdapter(pool_maxsize=concurrency)
+        connection.session.mount('https://', adapter)
+
         try:
             self.object_store = connection.object_store
             self.container = self.object_store.get_container_metadata(container)
@@ -59,8 +79,12 @@ class CloudFilesManager:
         if not new:
             return []
 
+        semaphore = asyncio.Semaphore(self.concurrency)
+
         async def upload(src, dst=None):
-            obj = await self.upload(src, dst)
+            async with semaphore:
+                obj = await self.upload(src, dst)
+
             self.print(f"- {dst}")
             return obj
 
@@ -100,11 +124,26 @@ class CloudFilesManager:
         if not existing:
             return []
 
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        # One listing of the container gives hashes of all remote files,
+        # instead of asking for every file's metadata separately.
+        # Local files are hashed in the meantime.
+        remote_hashes = asyncio.ensure_future(self.checksums())
+
         async def replace(src, dst):
-            src_changed = not await self.compare(src, dst)
+            async with semaphore:
+                local_hash = await self.md5sum(src)
+
+            try:
+                remote_hash = (await remote_hashes)[dst]
+            except KeyError:
+                raise exceptions.CloudFileNotFound(self.container.name, dst)
+
+            if local_hash != remote_hash:
+                async with semaphore:
+                    obj = await self.upload(src, dst)
 
-            if src_changed:
-                obj = await self.upload(src, dst)
                 self.print(f"- {dst}")
                 return obj
 
@@ -120,7 +159,14 @@ class CloudFilesManager:
             to_replace.append(replace(src, dst))
 
         self.print("Replacing outdated files:")
-        return [obj for obj in await asyncio.gather(*to_replace) if obj]
+
+        try:
+            replaced = await asyncio.gather(*to_replace)
+        finally:
+            # Don't leave the listing running if a local file cannot be read.
+            remote_hashes.cancel()
+
+        return [obj for obj in replaced if obj]
 
     async def delete(self, existing: Iterable[Union[Path, str]]) -> None:
         """Remove files from the :attr:`container`.
@@ -133,8 +179,12 @@ class CloudFilesManager:
         if not existing:
             return
 
+        semaphore = asyncio.Semaphore(self.concurrency)
+
         async def delete(dst):
-            obj = await self.erase(dst)
+            async with semaphore:
+                obj = await self.erase(dst)
+
             self.print(f"- {dst}")
             return obj
 
@@ -149,23 +199,32 @@ class CloudFilesManager:
     # Helpers
 
     @staticmethod
-    async def md5sum(src: Path) -> str:
-        """Compute MD5 hash of a file located at ``src``.
+    async def run(func: Callable, *args, **kwargs) -> Any:
+        """Call a blocking function (e.g., from OpenStack SDK) in a thread.
 
-        :raise OSError: if cannot open the file.
+        Requests to the Cloud can then be sent concurrently,
+        without blocking the event loop.
         """
-        checksum = md5()
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, partial(func, *args, **kwargs))
 
-        async with aiofiles.open(str(src), 'rb') as f:  # Can raise OSError
-            while True:
-                chunk = await f.read(4096)
+    @classmethod
+    async def md5sum(cls, src: Path) -> str:
+        """Compute MD5 hash of a file located at ``src``.
 
-                if chunk == b'':
-                    break
+        :raise OSError: if cannot open the file.
+        """
+        def md5sum():
+            with open(str(src), 'rb') as f:  # Can raise OSError
+                if os.fstat(f.fileno()).st_size == 0:
+                    return md5().hexdigest()  # Empty files cannot be mapped
 
-                checksum.update(chunk)
+                # Hash the file straight from the page cache,
+                # without copying its content in memory first.
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                    return md5(data).hexdigest()
 
-        return checksum.hexdigest()
+        return await cls.run(md5sum)
 
     async def upload(self, src: Path, dst: str = None) -> CloudObject:
         """Upload the content of a file located at ``src``.
@@ -178,11 +237,29 @@ class CloudFilesManager:
         """
         dst = dst or str(src)
 
-        async with aiofiles.open(str(src), 'rb') as source:  # Can raise OSError
-            data = await source.read()
+        def stream():
+            # Requests streams file objects, instead of loading them in memory.
+            # Giving a filename to the SDK instead would make it compute MD5 and
+            # SHA256 hashes of the file, and send two more requests before upload.
+            with open(str(src), 'rb') as source:
+                obj = self.object_store.upload_object(
+                    self.container, dst, data=source)
+
+            # Don't return a file which is already closed.
+            obj.data = None
+            return obj
+
+        size = os.path.getsize(str(src))  # Can raise OSError
 
         try:
-            return self.object_store.upload_object(self.container, dst, data=data)
+            if size < self.streaming_threshold:
+                async with aiofiles.open(str(src), 'rb') as source:
+                    data = await source.read()
+
+                return await self.run(
+                    self.object_store.upload_object, self.container, dst, data=data)
+
+            return await self.run(stream)
         except SDKException as exc:
             raise exceptions.CloudUploadError(exc)
 
@@ -195,31 +272,32 @@ class CloudFilesManager:
             if something wrong happens during download.
         """
         try:
-            return self.object_store.download_object(dst, self.container)
+            return await self.run(
+                self.object_store.download_object, dst, self.container)
         except ResourceNotFound:
             raise exceptions.CloudFileNotFound(self.container.name, dst)
         except SDKException as exc:
             raise exceptions.CloudError(exc)
 
-    async def compare(self, src: Path, dst: str) -> bool:
-        local_hash = await self.md5sum(src)
+    async def checksums(self) -> Dict[str, str]:
+        """Retrieve MD5 hashes of all files stored in the :attr:`container`.
+
+        :raise ~.CloudError: if something wrong happens while listing files.
+        """
+        def list_objects():
+            return list(self.object_store.objects(self.container.name))
 
         try:
-            obj = self.object_store.get_object(dst, self.container.name)
-            remote_hash = obj.etag
-        except ResourceNotFound:
-            raise exceptions.CloudFileNotFound(self.container.name, dst)
+            objects = await self.run(list_objects)
         except SDKException as exc:
             raise exceptions.CloudError(exc)
 
-        if local_hash != remote_hash:
-            return False
-
-        return True
+        return {obj.name: obj.etag for obj in objects}
 
     async def erase(self, dst: str):
         try:
-            self.object_store.delete_object(dst, container=self.container)
+            await self.run(
+                self.object_store.delete_object, dst, container=self.container)
         except ResourceNotFound:
             raise exceptions.CloudFileNotFound(self.container.name, dst)
         except SDKException as exc:
@@ -1,5 +1,7 @@
 """Base classes to be inherited by factories all over the project."""
 
+from typing import Iterable, List
+
 from factory.alchemy import SQLAlchemyModelFactory
 
 from website import db
@@ -16,3 +18,18 @@ class BaseDatabaseFactory(SQLAlchemyModelFactory):
         # So we don't have to do it manually, when playing around
         # in a Flask shell for example...
         sqlalchemy_session_persistence = 'commit'
+
+    @classmethod
+    def create_batch_by_uri(cls, uris: Iterable[str], **kwargs) -> List[object]:
+        """Create one item per URI, and save all of them at once.
+
+        Faster than creating items one by one, which commits the session every time.
+        Extra keyword arguments are passed to every item.
+        """
+        items = [cls.build(uri=uri, **kwargs) for uri in uris]
+
+        session = cls._meta.sqlalchemy_session
+        session.add_all(items)
+        session.commit()
+
+        return items
@@ -83,24 +83,33 @@ class GitRepository:
         :return: ``added``, ``modified``, ``renamed`` and ``deleted`` files.
         """
         diff = self._repo.commit(from_commit).diff(to_commit)
+        changes = {'A': [], 'M': [], 'R': [], 'D': []}
+
+        # Sort changes in one pass, instead of going through the diff
+        # once per change type with Diff.iter_change_type().
+        # Same rules as iter_change_type(): a file can be in several buckets,
+        # e.g., when renamed and modified in the same commit.
+        for change in diff:
+            if change.change_type == 'A' or change.new_file:
+                changes['A'].append(Path(change.b_path))
+
+            if change.change_type == 'R' or change.renamed_file:
+                changes['R'].append((Path(change.a_path), Path(change.b_path)))
+
+            if change.change_type == 'D' or change.deleted_file:
+                changes['D'].append(Path(change.a_path))
+
+            modified = (
+                change.a_blob and change.b_blob and change.a_blob != change.b_blob)
+
+            if change.change_type == 'M' or modified:
+                changes['M'].append(Path(change.b_path))
 
         pretty_diff = {
-            'added': sorted(
-                Path(d.b_blob.path)
-                for d in diff.iter_change_type('A')
-            ),
-            'modified': sorted(
-                Path(d.b_blob.path)
-                for d in diff.iter_change_type('M')
-            ),
-            'renamed': sorted(
-                (Path(d.a_blob.path), Path(d.b_blob.path))
-                for d in diff.iter_change_type('R')
-            ),
-            'deleted': sorted(
-                Path(d.a_blob.path)
-                for d in diff.iter_change_type('D')
-            ),
+            'added': sorted(changes['A']),
+            'modified': sorted(changes['M']),
+            'renamed': sorted(changes['R']),
+            'deleted': sorted(changes['D']),
         }
 
         return pretty_diff